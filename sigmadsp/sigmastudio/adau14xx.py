@@ -8,7 +8,7 @@ class Adau14xxHeaderGenerator(PacketHeaderGenerator):
     @staticmethod
     def new_write_header() -> PacketHeader:
         """Generate a new header for a ADAU14xx write packet."""
-        return PacketHeader(
+        header = PacketHeader(
             [
                 Field("operation", 0, 1),
                 Field("safeload", 1, 1),
@@ -19,11 +19,14 @@ class Adau14xxHeaderGenerator(PacketHeaderGenerator):
                 Field("address", 12, 2),
             ]
         )
+        header.freeze()
+
+        return header
 
     @staticmethod
     def new_read_request_header() -> PacketHeader:
         """Generate a new header for a ADAU14xx read request packet."""
-        return PacketHeader(
+        header = PacketHeader(
             [
                 Field("operation", 0, 1),
                 Field("total_length", 1, 4),
@@ -33,11 +36,14 @@ class Adau14xxHeaderGenerator(PacketHeaderGenerator):
                 Field("reserved", 12, 2),
             ]
         )
+        header.freeze()
+
+        return header
 
     @staticmethod
     def new_read_response_header() -> PacketHeader:
         """Generate a new header for a ADAU14xx read response packet."""
-        return PacketHeader(
+        header = PacketHeader(
             [
                 Field("operation", 0, 1),
                 Field("total_length", 1, 4),
@@ -48,3 +54,6 @@ class Adau14xxHeaderGenerator(PacketHeaderGenerator):
                 Field("reserved", 13, 1),
             ]
         )
+        header.freeze()
+
+        return header
@@ -8,7 +8,7 @@ class Adau1x01HeaderGenerator(PacketHeaderGenerator):
     @staticmethod
     def new_write_header() -> PacketHeader:
         """Generate a new header for a ADAU1x01 write packet."""
-        return PacketHeader(
+        header = PacketHeader(
             [
                 Field("operation", 0, 1),
                 Field("safeload", 1, 1),
@@ -19,11 +19,14 @@ class Adau1x01HeaderGenerator(PacketHeaderGenerator):
                 Field("address", 8, 2),
             ]
         )
+        header.freeze()
+
+        return header
 
     @staticmethod
     def new_read_request_header() -> PacketHeader:
         """Generate a new header for a ADAU1x01 read request packet."""
-        return PacketHeader(
+        header = PacketHeader(
             [
                 Field("operation", 0, 1),
                 Field("total_length", 1, 2),
@@ -32,14 +35,20 @@ class Adau1x01HeaderGenerator(PacketHeaderGenerator):
                 Field("address", 6, 2),
             ]
         )
+        header.freeze()
+
+        return header
 
     @staticmethod
     def new_read_response_header() -> PacketHeader:
         """Generate a new header for a ADAU1x01 read response packet."""
-        return PacketHeader(
+        header = PacketHeader(
             [
                 Field("operation", 0, 1),
                 Field("total_length", 1, 2),
                 Field("address", 3, 1),
             ]
         )
+        header.freeze()
+
+        return header
@@ -3,31 +3,82 @@
 Headers contain individual fields that follow each other in a certain sequence.
 """
 
+import copy
+import struct
 from abc import ABC, abstractmethod
-from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterator, List, Literal, Union
+from typing import Dict, Iterator, List, Literal, Optional, Tuple, Union
 
-from sigmadsp.helper.conversion import bytes_to_int, int_to_bytes
+from sigmadsp.helper.conversion import SIGMADSP_ENDIANNESS
+
+# Raw operation key values, as found in the operation field of a header.
+READ_REQUEST_KEY = 0x0A
+READ_RESPONSE_KEY = 0x0B
+WRITE_KEY = 0x09
 
 
 class OperationKey(Enum):
     """Possible operation keys that are exchanged with SigmaStudio."""
 
-    READ_REQUEST_KEY = 0x0A
-    READ_RESPONSE_KEY = 0x0B
-    WRITE_KEY = 0x09
+    READ_REQUEST_KEY = READ_REQUEST_KEY
+    READ_RESPONSE_KEY = READ_RESPONSE_KEY
+    WRITE_KEY = WRITE_KEY
+
+
+# The ``struct`` byte order character that matches the SigmaDSP endianness.
+STRUCT_BYTE_ORDER = ">" if SIGMADSP_ENDIANNESS == "big" else "<"
 
+# Unsigned integer ``struct`` format characters by field size in bytes.
+STRUCT_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+# Precompiled structures for packing and unpacking single fields, by field size in bytes. Field sizes that do not
+# map to a native integer type use a slower conversion path.
+FIELD_STRUCTS = {size: struct.Struct(STRUCT_BYTE_ORDER + field_format) for size, field_format in STRUCT_FORMATS.items()}
 
 ValidFieldNames = Literal[
     "operation", "safeload", "channel", "total_length", "chip_address", "data_length", "address", "success", "reserved"
 ]
 
 
-@dataclass
+def convert_field_value(value: Union[int, bytes, bytearray], size: int) -> int:
+    """Convert a value for storage in a field of a certain size.
+
+    Args:
+        value (Union[int, bytes, bytearray]): The value to convert. If ``int``, it is returned without conversion.
+            If ``bytes`` or ``bytearray``, it is first converted to int.
+        size (int): The size of the field in bytes.
+
+    Raises:
+        TypeError: If the value type is not supported.
+
+    Returns:
+        int: The converted value.
+    """
+    if isinstance(value, bytearray):
+        value = bytes(value)
+
+    if isinstance(value, bytes):
+        assert len(value) == size
+        return int.from_bytes(value, SIGMADSP_ENDIANNESS)
+
+    if isinstance(value, int):
+        assert value.bit_length() <= size * 8
+        return value
+
+    raise TypeError(f"Unsupported value type {type(value)} for the field value.")
+
+
+@dataclass(frozen=True)
 class Field:
-    """A class that represents a single field in the header."""
+    """A class that represents the layout of a single field in the header.
+
+    Fields are immutable, so that they can be shared between headers. Field values are stored in the headers.
+    """
+
+    # Slots avoid a per-instance dictionary. ``dataclass(slots=True)`` requires Python 3.10, so they are declared
+    # explicitly.
+    __slots__ = ("name", "offset", "size", "end")
 
     # The name of the field.
     name: ValidFieldNames
@@ -38,56 +89,97 @@ class Field:
     # The size of the field in bytes.
     size: int
 
-    @property
-    def value(self) -> int:
-        """The stored value."""
-        return self._value
+    def __post_init__(self):
+        """Perform sanity checks on the field properties."""
+        if self.size < 0:
+            raise ValueError("Field size must be a positive integer.")
 
-    @value.setter
-    def value(self, new_value: Union[int, bytes, bytearray]):
-        """Store a new value and convert it before storage, if required.
+        if self.offset < 0:
+            raise ValueError("Field offset must be a positive integer.")
 
-        Args:
-            new_value (Union[int, bytes, bytearray]): The new value to set. If ``int``, it is stored without conversion.
-                If ``bytes`` or ``bytearray``, it is first converted to int.
+        # The last byte index that is occupied by this field. The dataclass is frozen, so it is set via ``object``.
+        object.__setattr__(self, "end", self.offset + self.size - 1)
 
-        Raises:
-            TypeError: If the value type is not supported.
+    def __reduce__(self):
+        """Copy and pickle support.
+
+        The default state restore of slotted classes assigns attributes, which the frozen dataclass rejects, so the
+        field is rebuilt from its constructor arguments instead.
         """
-        if isinstance(new_value, bytearray):
-            new_value = bytes(new_value)
+        return (Field, (self.name, self.offset, self.size))
 
-        if isinstance(new_value, bytes):
-            assert len(new_value) == self.size
-            self._value = bytes_to_int(new_value, 0)
 
-        elif isinstance(new_value, int):
-            assert new_value.bit_length() <= self.size * 8
-            self._value = new_value
+class FieldView:
+    """A view on a single field of a packet header.
 
-        else:
-            raise TypeError(f"Unsupported value type {type(new_value)} for the field value.")
+    The view exposes the layout of the field, while its value is stored in the header that it belongs to. Views are
+    bound to the field name, so they stay valid when the header layout is rebuilt after adding fields.
+    """
 
-    def __post_init__(self):
-        """Perform sanity checks on the field properties."""
-        self.value = 0
+    __slots__ = ("_header", "_name")
 
-        if self.size < 0:
-            raise ValueError("Field size must be a positive integer.")
+    def __init__(self, header: "PacketHeader", name: str):
+        """Initialize the view.
 
-        if self.offset < 0:
-            raise ValueError("Field offset must be a positive integer.")
+        Args:
+            header (PacketHeader): The header that the field belongs to.
+            name (str): The name of the field in the header.
+        """
+        self._header = header
+        self._name = name
 
-        # The last byte index that is occupied by this field.
-        self.end = self.offset + self.size - 1
+    @property
+    def _field(self) -> Field:
+        """The layout of the field."""
+        return self._header._fields[self._name]  # pylint: disable=protected-access
 
-    def __hash__(self) -> int:
-        """Hash functionality."""
-        return hash((self.name, self.offset, self.size))
+    @property
+    def name(self) -> str:
+        """The name of the field."""
+        return self._name
+
+    @property
+    def offset(self) -> int:
+        """The offset of the field in bytes from the start of the header."""
+        return self._field.offset
+
+    @property
+    def size(self) -> int:
+        """The size of the field in bytes."""
+        return self._field.size
+
+    @property
+    def end(self) -> int:
+        """The last byte index that is occupied by this field."""
+        return self.offset + self.size - 1
+
+    @property
+    def value(self) -> int:
+        """The stored value."""
+        # pylint: disable-next=protected-access
+        return self._header._values[self._header._index_of(self._name)]
+
+    @value.setter
+    def value(self, new_value: Union[int, bytes, bytearray]):
+        """Store a new value in the header and convert it before storage, if required.
+
+        Args:
+            new_value (Union[int, bytes, bytearray]): The new value to set.
+        """
+        # pylint: disable-next=protected-access
+        self._header._set_value(self._header._index_of(self._name), new_value)
+
+    def __repr__(self) -> str:
+        """The representation of the field, including its value."""
+        return f"FieldView(name={self.name!r}, offset={self.offset}, size={self.size}, value={self.value})"
 
 
 class PacketHeader:
-    """An iterable collection of Field objects that forms the packet header."""
+    """An iterable collection of fields that forms the packet header.
+
+    The layout of the fields is stored in parallel arrays that are sorted by offset, with the field values kept
+    in a separate list. Individual fields are accessed through ``FieldView`` objects.
+    """
 
     def __init__(self, fields: List[Field]):
         """Initialize the header fields. Add more fields to it by means of ``add()``.
@@ -104,25 +196,59 @@ class PacketHeader:
         Args:
             fields (List[Field]): The list of fields to add initially.
         """
-        self._fields: OrderedDict[str, Field] = OrderedDict()  # pylint: disable=E1136
+        # The field layout as parallel arrays, sorted by offset, and the field values in the same order.
+        self._names: Tuple[str, ...] = ()
+        self._offsets: Tuple[int, ...] = ()
+        self._sizes: Tuple[int, ...] = ()
+        self._field_structs: Tuple[Optional[struct.Struct], ...] = ()
+        self._name_to_index: Dict[str, int] = {}
+        self._values: List[int] = []
+
+        # Whether the values list is shared with copies of this header, and has to be copied before modifying it.
+        self._shares_values = False
+
+        # Indices of the fields that are evaluated for every packet, or None, if the header does not contain them.
+        self._operation_index: Optional[int] = None
+        self._safeload_index: Optional[int] = None
+
+        # The header size, and a reusable buffer for serializing headers that cannot use a single precompiled
+        # structure. The buffer is allocated on first use.
+        self._size = 0
+        self._buffer: Optional[bytearray] = None
+
+        # Views on all fields, in the order of the layout arrays. Created on first use, and bound to this header.
+        self._field_views: Optional[Tuple[FieldView, ...]] = None
+
+        # A precompiled structure for the complete header, if all field sizes map to native integer types.
+        self._struct: Optional[struct.Struct] = None
+
+        # Fields are sorted, validated and compiled on first use of the header, or when calling ``freeze()``. As in
+        # ``add_field()``, fields with a name that already exists are ignored.
+        self._fields: Dict[str, Field] = {}
 
         for field in fields:
-            self.add_field(field)
+            self._fields.setdefault(field.name, field)
+
+        self._dirty = True
 
     @property
     def size(self) -> int:
         """The total size of the header in bytes."""
-        return sum((field.size for field in self))
+        self._ensure_ready()
+        return self._size
 
     @property
     def is_continuous(self) -> bool:
         """Whether or not there are spaces in the header that are not defined."""
-        fields_entries = self.as_list()
+        self._ensure_ready()
+        next_offset = self._offsets[0] if self._offsets else 0
 
-        for field, next_field in zip(fields_entries, fields_entries[1:]):
-            if (field.end + 1) != next_field.offset:
+        for offset, size in zip(self._offsets, self._sizes):
+            if offset != next_offset:
                 return False
 
+            next_offset = offset + size
+
         return True
 
     def _check_for_overlaps(self):
@@ -131,16 +257,18 @@ class PacketHeader:
         Raises:
             MemoryError: If overlapping fields are found.
         """
-        fields_entries = self.as_list()
+        previous_field: Optional[Field] = None
 
         # Check for overlapping fields, which are sorted by their offset.
-        for field, next_field in zip(fields_entries, fields_entries[1:]):
-            if not field.end <= next_field.offset:
-                raise MemoryError("Fields {field.name} and {next_field.name} overlap.")
+        for field in self._fields.values():
+            if previous_field is not None and field.offset <= previous_field.end:
+                raise MemoryError(f"Fields {previous_field.name} and {field.name} overlap.")
+
+            previous_field = field
 
     def _sort_fields_by_offset(self):
         """Sorts the fields in this header by their offset."""
-        self._fields = OrderedDict(sorted(self._fields.items(), key=lambda item: item[1].offset))
+        self._fields = dict(sorted(self._fields.items(), key=lambda item: item[1].offset))
 
     def add(self, name: ValidFieldNames, offset: int, size: int):
         """Create and add a new field.
@@ -154,33 +282,187 @@ class PacketHeader:
         self.add_field(field)
 
     def add_field(self, field: Field):
-        """Add a new field. Duplicates are ignored.
+        """Add a new field. Fields with a name that already exists in the header are ignored.
+
+        The field is validated together with the others, on the next use of the header.
 
         Args:
             field (Field): The field to add.
         """
-        if field not in self:
-            self._fields[field.name] = field
-
+        if field.name not in self._fields:
+            # The layout may be shared with copies of this header, so it is replaced instead of modified.
+            fields = dict(self._fields)
+            fields[field.name] = field
+            self._fields = fields
+            self._dirty = True
+
+    def _ensure_ready(self):
+        """Sort, validate and compile the layout, if fields were added since this was last done."""
+        if self._dirty:
             self._sort_fields_by_offset()
-            self._check_for_overlaps()
+            self._update_layout()
+            self._dirty = False
+
+    def _update_layout(self):
+        """Validate the sorted fields and rebuild the layout arrays from them, while keeping existing field values."""
+        self._check_for_overlaps()
+
+        values = dict(zip(self._names, self._values))
+        fields = self._fields.values()
+
+        self._names = tuple(field.name for field in fields)
+        self._offsets = tuple(field.offset for field in fields)
+        self._sizes = tuple(field.size for field in fields)
+        self._field_structs = tuple(FIELD_STRUCTS.get(size) for size in self._sizes)
+        self._name_to_index = {name: index for index, name in enumerate(self._names)}
+        self._values = [values.get(field.name, 0) for field in fields]
+        self._shares_values = False
+
+        self._operation_index = self._name_to_index.get("operation")
+        self._safeload_index = self._name_to_index.get("safeload")
+
+        self._size = self._offsets[-1] + self._sizes[-1] if self._fields else 0
+        self._buffer = None
+        self._field_views = None
+
+        self._compile_struct()
+
+    def copy(self) -> "PacketHeader":
+        """Create a copy of this header.
+
+        The copy shares the (immutable) layout with this header. Field values are shared as well, until either
+        header modifies them (copy-on-write), so that copies which are only inspected or fully parsed never copy
+        their values.
+
+        Returns:
+            PacketHeader: The copied header.
+        """
+        # Copies share the layout, so it is prepared once in the original.
+        self._ensure_ready()
+
+        header = copy.copy(self)
+        header._buffer = None  # pylint: disable=protected-access
+        header._field_views = None  # pylint: disable=protected-access
+
+        self._shares_values = True
+        header._shares_values = True  # pylint: disable=protected-access
+
+        return header
+
+    def __copy__(self) -> "PacketHeader":
+        """Shallow copy support, which shares the compiled layout with the original."""
+        header = self.__class__.__new__(self.__class__)
+        header.__dict__.update(self.__dict__)
+
+        return header
+
+    def __getstate__(self) -> Dict:
+        """Deep copy and pickle support.
+
+        Compiled structures cannot be pickled. They are derived from the layout, so they are dropped here and
+        rebuilt on first use of the restored header.
+        """
+        state = self.__dict__.copy()
+        state.update(
+            _struct=None, _field_structs=(), _buffer=None, _field_views=None, _shares_values=False, _dirty=True
+        )
+
+        return state
+
+    @property
+    def _views(self) -> Tuple[FieldView, ...]:
+        """Views on all fields of this header for iteration, which are created only once."""
+        self._ensure_ready()
+
+        if self._field_views is None:
+            self._field_views = tuple(FieldView(self, name) for name in self._names)
+
+        return self._field_views
+
+    def _index_of(self, name: str) -> int:
+        """Get the current index of a field in the layout arrays.
+
+        Args:
+            name (str): The name of the field.
+
+        Returns:
+            int: The index of the field.
+        """
+        self._ensure_ready()
+        return self._name_to_index[name]
+
+    def _set_value(self, index: int, value: Union[int, bytes, bytearray]):
+        """Convert and store a field value, after detaching the values from any copies of this header.
+
+        Args:
+            index (int): The index of the field.
+            value (Union[int, bytes, bytearray]): The field value.
+        """
+        if self._shares_values:
+            self._values = list(self._values)
+            self._shares_values = False
+
+        self._values[index] = convert_field_value(value, self._sizes[index])
+
+    def freeze(self):
+        """Sort, validate and compile the header layout now, instead of on the first use of the header.
+
+        Raises:
+            MemoryError: If overlapping fields are found.
+        """
+        self._ensure_ready()
+
+    def _compile_struct(self):
+        """Compile the header layout into a single structure for fast packing and parsing.
+
+        Headers with field sizes that do not map to a native integer type cannot be compiled and use the field by
+        field conversion.
+        """
+        if not all(size in STRUCT_FORMATS for size in self._sizes):
+            self._struct = None
+            return
+
+        struct_format = STRUCT_BYTE_ORDER
+        position = 0
+
+        for offset, size in zip(self._offsets, self._sizes):
+            # Undefined spaces between fields are filled with pad bytes.
+            if offset > position:
+                struct_format += f"{offset - position}x"
+
+            struct_format += STRUCT_FORMATS[size]
+            position = offset + size
+
+        self._struct = struct.Struct(struct_format)
 
     def as_bytes(self) -> bytes:
         """Get the full header as a bytes object."""
-        buffer = bytearray()
+        self._ensure_ready()
 
-        for field in self:
-            int_to_bytes(field.value, buffer, field.offset, field.size)
+        if self._struct is not None:
+            return self._struct.pack(*self._values)
 
-        return bytes(buffer)
+        if self._buffer is None:
+            self._buffer = bytearray(self._size)
 
-    def as_list(self) -> List[Field]:
+        # Fields always overwrite their own bytes, and undefined spaces are never written, so the buffer can be
+        # reused without clearing it.
+        for offset, size, field_struct, value in zip(self._offsets, self._sizes, self._field_structs, self._values):
+            if field_struct is not None:
+                field_struct.pack_into(self._buffer, offset, value)
+
+            else:
+                self._buffer[offset : offset + size] = value.to_bytes(size, SIGMADSP_ENDIANNESS)
+
+        return bytes(self._buffer)
+
+    def as_list(self) -> List[FieldView]:
         """The fields as a list.
 
         Returns:
-            List[Field]: The list of fields.
+            List[FieldView]: The list of fields.
         """
-        return list(self._fields.values())
+        return list(self)
 
     def parse(self, data: bytes):
         """Parse a header and populate field values.
@@ -188,31 +470,107 @@ class PacketHeader:
         Args:
             data (bytes): The data to parse.
         """
-        if len(data) != self.size:
-            raise ValueError(f"Input data needs to be exactly {self.size} bytes long!")
+        self._ensure_ready()
+
+        if len(data) != self._size:
+            raise ValueError(f"Input data needs to be exactly {self._size} bytes long!")
+
+        # All values are replaced, so a new list is created instead of modifying a list that might be shared.
+        if self._struct is not None:
+            self._values = list(self._struct.unpack(data))
+
+        else:
+            self._values = self._unpack_fields(data)
+
+        self._shares_values = False
+
+    def parse_many(self, data: bytes) -> Dict[str, Tuple[int, ...]]:
+        """Parse a sequence of headers with the layout of this header, that directly follow each other in the data.
+
+        The values are returned per field, without creating a header object for every parsed header. This header's
+        own field values are not changed.
+
+        Args:
+            data (bytes): The data to parse. Its length must be a multiple of the header size.
+
+        Raises:
+            ValueError: If the data length is not a multiple of the header size.
+
+        Returns:
+            Dict[str, Tuple[int, ...]]: The values of all parsed headers in order, by field name.
+        """
+        self._ensure_ready()
+
+        if not self._size or len(data) % self._size:
+            raise ValueError(f"Input data length needs to be a multiple of {self._size} bytes!")
+
+        if self._struct is not None:
+            columns = list(zip(*self._struct.iter_unpack(data)))
+
+        else:
+            columns = list(zip(*(self._unpack_fields(data, start) for start in range(0, len(data), self._size))))
 
-        for field in self:
-            field.value = bytes_to_int(data, field.offset, field.size)
+        if not columns:
+            columns = [()] * len(self._names)
+
+        return dict(zip(self._names, columns))
+
+    def _unpack_fields(self, data: bytes, start: int = 0) -> List[int]:
+        """Unpack the field values one by one, for headers that cannot use a single structure.
+
+        Args:
+            data (bytes): The data to unpack the values from.
+            start (int, optional): The offset of the header in the data. Defaults to 0.
+
+        Returns:
+            List[int]: The field values.
+        """
+        return [
+            int.from_bytes(data[start + offset : start + offset + size], SIGMADSP_ENDIANNESS)
+            if field_struct is None
+            else field_struct.unpack_from(data, start + offset)[0]
+            for offset, size, field_struct in zip(self._offsets, self._sizes, self._field_structs)
+        ]
+
+    @property
+    def _operation(self) -> int:
+        """The value of the operation field.
+
+        Raises:
+            KeyError: If the header has no operation field.
+        """
+        self._ensure_ready()
+
+        if self._operation_index is None:
+            raise KeyError("operation")
+
+        return self._values[self._operation_index]
 
     @property
     def is_write_request(self) -> bool:
         """Whether this is a write request."""
-        return self._fields["operation"].value == OperationKey.WRITE_KEY.value
+        return self._operation == WRITE_KEY
 
     @property
     def is_read_request(self) -> bool:
         """Whether this is a read request."""
-        return self._fields["operation"].value == OperationKey.READ_REQUEST_KEY.value
+        return self._operation == READ_REQUEST_KEY
 
     @property
     def is_read_response(self) -> bool:
         """Whether this is a read response."""
-        return self._fields["operation"].value == OperationKey.READ_RESPONSE_KEY.value
+        return self._operation == READ_RESPONSE_KEY
 
     @property
     def is_safeload(self) -> bool:
         """Whether this is a software-safeload write request."""
-        return self.is_write_request and self._fields["safeload"].value == 1
+        if not self.is_write_request:
+            return False
+
+        if self._safeload_index is None:
+            raise KeyError("safeload")
+
+        return self._values[self._safeload_index] == 1
 
     @property
     def carries_payload(self) -> bool:
@@ -220,14 +578,14 @@ class PacketHeader:
         return self.is_write_request or self.is_read_response
 
     @property
-    def names(self) -> List[str]:
-        """All field names in a list."""
-        return [field.name for field in self]
+    def names(self) -> Tuple[str, ...]:
+        """All field names in a tuple, sorted by field offset."""
+        self._ensure_ready()
+        return self._names
 
-    def __iter__(self) -> Iterator[Field]:
+    def __iter__(self) -> Iterator[FieldView]:
         """The iterator for fields."""
-        for item in self._fields.values():
-            yield item
+        return iter(self._views)
 
     def __setitem__(self, name: ValidFieldNames, value: Union[int, bytes, bytearray]):
         """Set a field value.
@@ -236,25 +594,32 @@ class PacketHeader:
             name (ValidFieldNames): Field name.
             value (Union[int, bytes, bytearray]): Field value.
         """
-        if name not in self.names:
-            raise ValueError(f"Invalid field name {name}; valid names are {', '.join(self.names)}")
+        self._ensure_ready()
+
+        if name not in self._name_to_index:
+            raise ValueError(f"Invalid field name {name}; valid names are {', '.join(self._names)}")
 
-        # FIXME: Type is correct, see https://github.com/python/mypy/issues/3004.
-        self._fields[name].value = value  # type: ignore
+        self._set_value(self._name_to_index[name], value)
 
-    def __getitem__(self, name: ValidFieldNames) -> Field:
+    def __getitem__(self, name: ValidFieldNames) -> FieldView:
         """Get a field by its name.
 
         Args:
             name (ValidFieldNames): The name of the field.
 
         Returns:
-            Union[Field, None]: The field, or None, if no field was found.
+            FieldView: A view on the field.
 
         Raises:
-            IndexError: If the field does not exist.
+            KeyError: If the field does not exist.
         """
-        return self._fields[name]
+        self._ensure_ready()
+
+        # A single view is cheaper than creating the cached views of all fields.
+        if name not in self._name_to_index:
+            raise KeyError(name)
+
+        return FieldView(self, name)
 
     def __contains__(self, name: ValidFieldNames) -> bool:
         """Magic methods for using ``in``.
@@ -271,6 +636,20 @@ class PacketHeader:
 class PacketHeaderGenerator(ABC):
     """Generic generator for packet headers."""
 
+    def __init__(self):
+        """Initialize the generator."""
+        # Prototype headers by their raw operation key, for dispatching on received operation bytes. Headers for
+        # received packets are copied from these, instead of building their layout from scratch.
+        self._prototypes: Dict[int, PacketHeader] = {
+            WRITE_KEY: self.new_write_header(),
+            READ_REQUEST_KEY: self.new_read_request_header(),
+            READ_RESPONSE_KEY: self.new_read_response_header(),
+        }
+
+        # Prototypes carry their operation key already, so that copies do not need to modify their values.
+        for operation_key, prototype in self._prototypes.items():
+            prototype["operation"] = operation_key
+
     @staticmethod
     @abstractmethod
     def new_write_header() -> PacketHeader:
@@ -300,20 +679,12 @@ class PacketHeaderGenerator(ABC):
         """
         assert len(operation_byte) == 1, "Operation byte must have a length of 1."
 
-        operation_key = OperationKey(bytes_to_int(operation_byte, offset=0, length=1))
-
-        header: PacketHeader
-        if operation_key == OperationKey.READ_REQUEST_KEY:
-            header = self.new_read_request_header()
+        operation_key = operation_byte[0]
 
-        elif operation_key == OperationKey.READ_RESPONSE_KEY:
-            header = self.new_read_response_header()
+        try:
+            prototype = self._prototypes[operation_key]
 
-        elif operation_key == OperationKey.WRITE_KEY:
-            header = self.new_write_header()
+        except KeyError as error:
+            raise ValueError(f"Unknown operation key {operation_key}.") from error
 
-        else:
-            raise ValueError(f"Unknown operation key {operation_key}.")
-
-        header["operation"] = operation_byte
-        return header
+        return prototype.copy()
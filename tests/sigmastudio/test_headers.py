@@ -1,9 +1,13 @@
 """Tests for the sigmastudio header generators."""
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from sigmadsp.helper.conversion import int8_to_bytes, int16_to_bytes
 from sigmadsp.sigmastudio.adau1x01 import Adau1x01HeaderGenerator
-from sigmadsp.sigmastudio.header import Field, OperationKey
+from sigmadsp.sigmastudio.header import Field, OperationKey, PacketHeader
 
 
 def test_adau1x01_header_generator():
@@ -36,6 +40,15 @@ def test_adau1x01_header_generator():
 
     assert "operation" in write_header
     assert "not_in_there" not in write_header
+    assert write_header.names[0] == "operation"
+
+    with pytest.raises(ValueError):
+        write_header["not_in_there"] = 0
+
+    # Values set through a field are stored in the header.
+    write_header["address"].value = 0x1234
+    assert write_header["address"].value == 0x1234
+    assert write_header.as_bytes()[-2:] == b"\x12\x34"
 
     # Test the generation of headers from an operation byte.
     read_request_header = header_generator.new_header_from_operation_byte(
@@ -51,19 +64,196 @@ def test_adau1x01_header_generator():
     )
     assert read_response_header.is_read_response
 
+    with pytest.raises(ValueError):
+        header_generator.new_header_from_operation_byte(b"\xff")
+
+    # Headers from the same operation byte do not share their values.
+    another_write_header["address"] = 0x1234
+    yet_another_write_header = header_generator.new_header_from_operation_byte(
+        int8_to_bytes(OperationKey.WRITE_KEY.value)
+    )
+    assert yet_another_write_header["address"].value == 0
+
 
 def test_field():
     """Test setting values in fields."""
     operation_field = Field("operation", 0, 1)
 
+    with pytest.raises(FrozenInstanceError) as _:
+        # Field layouts are immutable
+        operation_field.offset = 1  # type: ignore
+
+    header = PacketHeader([operation_field])
+
     with pytest.raises(AssertionError) as _:
         # Does not fit in one byte
-        operation_field.value = b"\x1234"
+        header["operation"].value = b"\x1234"
 
-    operation_field.value = b"\x90"
+    header["operation"].value = b"\x90"
 
     with pytest.raises(AssertionError) as _:
         # 256 does not fit in one byte
-        operation_field.value = 256
+        header["operation"].value = 256
+
+    header["operation"].value = 10
+
+
+def test_header_with_odd_field_size():
+    """Test packing and parsing fields that do not map to a native integer size."""
+    header = PacketHeader([Field("operation", 0, 1), Field("address", 1, 3), Field("data_length", 4, 2)])
+
+    header_message = b"\x09\x01\x02\x03\x00\x04"
+    header.parse(header_message)
+
+    assert header["address"].value == 0x010203
+    assert header["data_length"].value == 4
+    assert header.as_bytes() == header_message
+
+
+def test_header_with_undefined_space():
+    """Test that undefined spaces between fields count towards the size and serialize as zeros."""
+    header = PacketHeader([Field("operation", 0, 1), Field("address", 2, 2)])
+
+    assert not header.is_continuous
+    assert header.size == 4
+
+    header.parse(b"\x09\xff\x12\x34")
+
+    assert header["address"].value == 0x1234
+    assert header.as_bytes() == b"\x09\x00\x12\x34"
+
+    # Freezing the header must not change its behavior.
+    header.freeze()
+    header.parse(b"\x0a\xff\x56\x78")
+
+    assert header["operation"].value == 0x0A
+    assert header["address"].value == 0x5678
+    assert header.as_bytes() == b"\x0a\x00\x56\x78"
+
+
+def test_overlapping_fields():
+    """Test that overlapping fields are rejected, when the header layout is validated."""
+    with pytest.raises(MemoryError):
+        PacketHeader([Field("operation", 0, 2), Field("address", 1, 2)]).freeze()
+
+    header = PacketHeader([Field("operation", 0, 1), Field("address", 1, 2)])
+    header.add("data_length", 2, 1)
+
+    with pytest.raises(MemoryError):
+        header.as_bytes()
+
+
+def test_header_copy():
+    """Test that copied headers do not share modified values."""
+    header = PacketHeader([Field("operation", 0, 1), Field("address", 1, 2)])
+    header["address"] = 0x1234
+    assert header["address"].value == 0x1234
+
+    header_copy = header.copy()
+    assert header_copy["address"].value == 0x1234
+
+    header_copy["address"].value = 0x5678
+    assert header["address"].value == 0x1234
+
+    header["operation"] = 0x09
+    assert header_copy["operation"].value == 0
+
+    header_copy.parse(b"\x0a\x00\x01")
+    assert header.as_bytes() == b"\x09\x12\x34"
+    assert header_copy.as_bytes() == b"\x0a\x00\x01"
+
+
+def test_parse_many():
+    """Test parsing a sequence of headers at once."""
+    frozen_header = PacketHeader([Field("operation", 0, 1), Field("address", 2, 2)])
+    frozen_header.freeze()
+    header = PacketHeader([Field("operation", 0, 1), Field("address", 1, 3)])
+
+    assert frozen_header.parse_many(b"\x09\x00\x12\x34\x0a\x00\x56\x78") == {
+        "operation": (0x09, 0x0A),
+        "address": (0x1234, 0x5678),
+    }
+    assert header.parse_many(b"\x09\x00\x12\x34\x0a\x00\x56\x78") == {
+        "operation": (0x09, 0x0A),
+        "address": (0x1234, 0x5678),
+    }
+    assert header.parse_many(b"") == {"operation": (), "address": ()}
+
+    with pytest.raises(ValueError):
+        header.parse_many(b"\x09\x00\x12")
+
+
+def test_add_field():
+    """Test adding fields to an existing header."""
+    header = PacketHeader([Field("operation", 0, 1)])
+    header["operation"] = 0x09
+
+    header.add("address", 1, 2)
+    assert header.names == ("operation", "address")
+    assert header["operation"].value == 0x09
+    assert header.size == 3
+
+    # Fields with an existing name are ignored.
+    header.add("address", 3, 4)
+    assert header["address"].offset == 1
+    assert header.size == 3
+
+    # The same applies to fields that are passed on construction.
+    header = PacketHeader([Field("operation", 0, 1), Field("address", 1, 2), Field("address", 3, 4)])
+    assert header["address"].offset == 1
+    assert header.size == 3
+
+
+def test_predicates_without_operation_field():
+    """Test that operation predicates name the missing field."""
+    header = PacketHeader([Field("address", 0, 2)])
+
+    with pytest.raises(KeyError, match="operation"):
+        _ = header.is_write_request
+
+    with pytest.raises(KeyError, match="operation"):
+        _ = header.carries_payload
+
+    header = PacketHeader([Field("operation", 0, 1)])
+    header["operation"] = 0x09
+
+    with pytest.raises(KeyError, match="safeload"):
+        _ = header.is_safeload
+
+
+def test_field_view_after_adding_fields():
+    """Test that field views keep referring to their field, when the header layout changes."""
+    header = PacketHeader([Field("address", 2, 2)])
+    address_field = header["address"]
+
+    header.add("operation", 0, 1)
+
+    assert address_field.name == "address"
+    assert address_field.offset == 2
+
+    address_field.value = 0x1234
+    assert header["operation"].value == 0
+    assert header.as_bytes() == b"\x00\x00\x12\x34"
+
+
+def test_field_copy_and_pickle():
+    """Test that immutable fields can be copied and pickled."""
+    field = Field("address", 1, 2)
+
+    for field_copy in (copy.copy(field), copy.deepcopy(field), pickle.loads(pickle.dumps(field))):
+        assert field_copy == field
+        assert field_copy.end == 2
+
+
+def test_header_deepcopy_and_pickle():
+    """Test that headers can be deep-copied and pickled, including their values."""
+    header = Adau1x01HeaderGenerator().new_header_from_operation_byte(int8_to_bytes(OperationKey.WRITE_KEY.value))
+    header["address"] = 0x1234
+
+    for header_copy in (copy.deepcopy(header), pickle.loads(pickle.dumps(header))):
+        assert header_copy.is_write_request
+        assert header_copy["address"].value == 0x1234
+        assert header_copy.as_bytes() == header.as_bytes()
 
-    operation_field.value = 10
+        header_copy["address"] = 0x5678
+        assert header["address"].value == 0x1234